@@ -16,104 +16,251 @@ How to Use:
     python get_context.py
 3. The output will be saved to 'GET_CONTEXT.txt' in the same directory.
 
+Options:
+    [root_dir]     Scan only the given subtree (default: current
+                   directory). Starting the walk at the subtree of
+                   interest means unrelated siblings are never
+                   traversed at all.
+    --tree-only    Emit only the directory tree; no file is ever opened,
+                   so the run does no content I/O at all.
+
+Notes:
+- File contents are copied into the report byte-for-byte; no decoder
+  runs over them, so large JSON/text files cost only the I/O of the
+  copy and non-UTF-8 bytes pass through untouched.
+
 Author: Farimah M. Nassiri
 Date: 2025-02-19
 Version: 2.0
 """
+import json
 import os
+import re
+import shutil
+import sys
+
+# Filter tables, built once at import time so the scan loop only does
+# set membership and a single endswith check per entry
+
+# Allowed file extensions
+ALLOWED_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.css', '.scss', '.html', '.json', '.md', '.txt', '.mjs')
+
+# Specific files we always want regardless of extension checks
+ALLOWED_NAMES = frozenset({'package.json', 'tsconfig.json'})
+
+# Directories to skip
+SKIP_DIRS = frozenset({'node_modules', 'public', '.git', '.next', '.vercel'})
+
+# Sidecar recording each matched file's (mtime_ns, size) from the last
+# run; when nothing changed, the whole rewrite is skipped
+CACHE_FILE = '.get_context_cache.json'
+
+# Files to skip entirely - will not even attempt to open these.
+# The script's own output must be excluded or re-runs would fold the
+# previous report into the new one and never look unchanged.
+SKIP_FILES = frozenset({'.DS_Store', '.gitignore', 'package-lock.json', 'yarn.lock', '.env.local', 'README.md', '.env', CACHE_FILE, 'GET_CONTEXT.txt'})
+
+# The tables above compiled into anchored regexes, so each filename is
+# classified with one C-level match instead of chained str methods
+REJECT_RE = re.compile(
+    r'^(?:' + '|'.join(re.escape(name) for name in sorted(SKIP_FILES)) + r')$')
+ACCEPT_RE = re.compile(
+    r'.*(?:' + '|'.join(re.escape(ext) for ext in ALLOWED_EXTENSIONS) + r')$'
+    r'|^(?:' + '|'.join(re.escape(name) for name in sorted(ALLOWED_NAMES)) + r')$',
+    re.IGNORECASE)
+
+# Delimiter line used around headers and file content blocks
+DELIM = b"===================================================================\n"
 
 def get_file_structure(root_dir):
     file_structure = []
-    files_content = []
-    
-    # Define allowed file extensions
-    allowed_extensions = ('.ts', '.tsx', '.js', '.jsx', '.css', '.scss', '.html', '.json', '.md', '.txt', '.mjs')
-    
-    # Define directories to skip
-    skip_dirs = {'node_modules', 'public', '.git', '.next', '.vercel'}
-    
-    # Define files to skip entirely - will not even attempt to open these
-    skip_files = {'.DS_Store', '.gitignore', 'package-lock.json', 'yarn.lock', '.env.local', 'README.md', '.env'}
-    
-    for subdir, dirs, files in os.walk(root_dir):
-        # Skip unwanted directories immediately
-        dirs[:] = [d for d in dirs if d not in skip_dirs]
-        
-        for file in files:
+    matched_paths = []
+
+    # Stat fingerprint of every matched file, used for change detection
+    file_stats = {}
+
+    # Token unique to this run: a file whose stat fails is tagged with
+    # it, so its record can never compare equal to a previous run's
+    # (a shared sentinel like None would survive the JSON round-trip
+    # and make two consecutive failures look unchanged)
+    run_token = os.urandom(8).hex()
+
+    # Directory tree built as we scan: directories map to child dicts,
+    # matched files map to None, so no path re-splitting is needed later
+    tree = {}
+
+    # Normalize the root once so relative paths can be produced by a
+    # constant-length slice of entry.path, with no os.path.join or
+    # os.path.relpath call per file. A root that still ends with the
+    # separator after stripping (i.e. the filesystem root) already
+    # contributes its trailing separator to entry.path, so no extra
+    # separator is added for it.
+    root_dir = root_dir.rstrip(os.sep) or os.sep
+    if root_dir.endswith(os.sep):
+        root_prefix_len = len(root_dir)
+    else:
+        root_prefix_len = len(root_dir) + len(os.sep)
+
+    def _scan(dir_path, tree_node):
+        # os.scandir reuses the DirEntry type information from the directory
+        # listing itself, so is_dir()/is_file() need no extra stat calls
+        try:
+            scandir_it = os.scandir(dir_path)
+        except OSError as e:
+            print(f"Error scanning directory {dir_path}: {str(e)}")
+            return
+
+        # Sort entries by name once per directory so the tree dicts are
+        # built in display order and the write phase needs no sorting
+        with scandir_it:
+            entries = sorted(scandir_it, key=lambda e: e.name)
+
+        for entry in entries:
+            # Skip unwanted directories immediately
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    child = {}
+                    _scan(entry.path, child)
+                    # Only keep directories that contain matched files
+                    if child:
+                        tree_node[entry.name] = child
+                continue
+
+            if not entry.is_file(follow_symlinks=False):
+                continue
+
+            file = entry.name
+
             # Skip files that match any patterns we want to ignore
-            if (file in skip_files or 
-                file.endswith('.env.local') or  # Additional check for .env.local
-                os.path.basename(file) in skip_files):
+            if REJECT_RE.match(file):
                 continue
-            
-            file_path = os.path.join(subdir, file)
-            relative_path = os.path.relpath(file_path, root_dir)
-            
+
             # Check if file extension is allowed or if it's a specific file we want
-            if (file.lower().endswith(allowed_extensions) or 
-                file in {'package.json', 'tsconfig.json'}):
+            if ACCEPT_RE.match(file):
+                file_path = entry.path
+                relative_path = file_path[root_prefix_len:]
+
+                # Add to file structure; contents are streamed at write time
+                file_structure.append(relative_path)
+                matched_paths.append((relative_path, file_path))
+                tree_node[file] = None
+
                 try:
-                    # Add to file structure
-                    file_structure.append(relative_path)
-                    
-                    # Read and add content for text files
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        file_content = f.read()
-                        files_content.append((relative_path, file_content))
-                        
-                except Exception as e:
-                    print(f"Error reading file {file_path}: {str(e)}")
-    
-    return file_structure, files_content
+                    stat = entry.stat(follow_symlinks=False)
+                    file_stats[relative_path] = [stat.st_mtime_ns, stat.st_size]
+                except OSError:
+                    # Unstattable files simply never count as cached
+                    file_stats[relative_path] = run_token
+
+    _scan(root_dir, tree)
+    return file_structure, matched_paths, tree, file_stats
+
+def load_cached_stats():
+    """Load the stat fingerprints recorded by the previous run, if any."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_stats(file_stats):
+    """Record the current stat fingerprints for the next run."""
+    try:
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(file_stats, f)
+    except OSError as e:
+        print(f"Warning: could not write cache file: {str(e)}")
 
-def write_context_file(file_structure, files_content, output_file):
+def write_context_file(file_structure, matched_paths, tree, output_file, include_content=True):
     total_files = len(file_structure)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
+    # Binary mode: file contents are copied through verbatim as bytes,
+    # so no decode/encode round-trip is paid per file. The large buffer
+    # keeps the many small header/delimiter writes off the syscall path.
+    with open(output_file, 'wb', buffering=1 << 20) as f:
         # Write header
-        f.write("===================================================================\n")
-        f.write("                   FILES & FOLDER STRUCTURE\n")
-        f.write("===================================================================\n\n")
-        
-        # Create tree structure
-        tree = {}
-        for path in sorted(file_structure):
-            parts = path.split(os.sep)
-            current_level = tree
-            for part in parts:
-                if part not in current_level:
-                    current_level[part] = {}
-                current_level = current_level[part]
-        
-        # Write tree structure
-        def write_tree(level, indent=""):
-            for name, subtree in sorted(level.items()):
-                if subtree:
-                    f.write(f"{indent}+ {name}/\n")
-                    write_tree(subtree, indent + "  ")
-                else:
-                    f.write(f"{indent}  - {name}\n")
-        
-        write_tree(tree)
+        f.write(DELIM)
+        f.write(b"                   FILES & FOLDER STRUCTURE\n")
+        f.write(DELIM + b"\n")
         
+        # Write tree structure (built incrementally during the scan;
+        # files are None leaves, directories are nested dicts).
+        # Iterative depth-first walk: an explicit stack of iterators
+        # avoids a Python call frame per directory and lets the whole
+        # tree go out in a single buffered write.
+        lines = []
+        stack = [(iter(tree.items()), "")]
+        while stack:
+            level_iter, indent = stack[-1]
+            for name, subtree in level_iter:
+                if subtree is not None:
+                    lines.append(f"{indent}+ {name}/\n")
+                    stack.append((iter(subtree.items()), indent + "  "))
+                    break
+                lines.append(f"{indent}  - {name}\n")
+            else:
+                stack.pop()
+        f.write("".join(lines).encode('utf-8'))
+
         # Write file count
-        f.write(f"\n===== TOTAL FILES: {total_files} =====\n\n")
+        f.write(f"\n===== TOTAL FILES: {total_files} =====\n\n".encode('utf-8'))
         
-        # Write file contents
-        for path, content in sorted(files_content):
-            f.write("===================================================================\n")
-            f.write(f"FILE PATH: {os.path.join(path)}\n")
-            f.write("===================================================================\n\n")
-            f.write(content)
-            f.write("\n// END OF FILE\n\n")
+        # Contents are only ever opened here, so tree-only runs skip
+        # all content I/O entirely
+        if not include_content:
+            return
+
+        # Stream file contents straight into the output so only one
+        # file's data is in flight at a time. The scan already yields
+        # paths in per-directory sorted order, so no resort is needed.
+        for path, file_path in matched_paths:
+            try:
+                src = open(file_path, 'rb')
+            except Exception as e:
+                print(f"Error reading file {file_path}: {str(e)}")
+                continue
+            with src:
+                f.write(DELIM)
+                f.write(f"FILE PATH: {path}\n".encode('utf-8'))
+                f.write(DELIM + b"\n")
+                shutil.copyfileobj(src, f, 1 << 20)
+                f.write(b"\n// END OF FILE\n\n")
 
 def main():
-    root_dir = '.'  # Current directory
+    # An optional positional argument narrows the scan to one subtree,
+    # so irrelevant siblings are never descended into at all
+    positional = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    root_dir = positional[0] if positional else '.'
     output_file = 'GET_CONTEXT.txt'
-    
+    include_content = '--tree-only' not in sys.argv[1:]
+
+    if not os.path.isdir(root_dir):
+        print(f"Error: '{root_dir}' is not a directory.")
+        return
+
     try:
-        file_structure, files_content = get_file_structure(root_dir)
-        write_context_file(file_structure, files_content, output_file)
+        file_structure, matched_paths, tree, file_stats = get_file_structure(root_dir)
+
+        # If no matched file changed since the last full run, the output
+        # is already correct and all content I/O can be skipped.
+        # Delete the cache file to force a rewrite.
+        if (include_content and os.path.exists(output_file)
+                and load_cached_stats() == file_stats):
+            print(f"Context file '{output_file}' is up to date; no files changed.")
+            return
+
+        write_context_file(file_structure, matched_paths, tree, output_file, include_content)
+        if include_content:
+            save_cached_stats(file_stats)
+        else:
+            # A tree-only run replaces the report with one that has no
+            # content blocks; the previous full-run fingerprints no
+            # longer describe the file on disk, so drop them or the
+            # next full run would wrongly skip the rewrite
+            try:
+                os.remove(CACHE_FILE)
+            except OSError:
+                pass
         print(f"Context file '{output_file}' created successfully!")
         print(f"Total files processed: {len(file_structure)}")
     except Exception as e:
@@ -7,9 +7,12 @@ Description: This script automatically processes the first SVG file found in the
 
 Dependencies:
 - Standard Python Library (no external packages required)
+- lxml (optional; used automatically for faster parsing when installed)
 
 Installation:
 No additional installation is required. This script only uses standard Python libraries.
+For a faster C-based parser on large SVGs, optionally run:
+    pip install lxml
 
 How to Use:
 1. Place your SVG file in the same directory as this script.
@@ -22,10 +25,22 @@ Date: 2025-02-19
 Version: 2.0
 """
 
-import xml.etree.ElementTree as ET
+# Prefer lxml's libxml2-backed parser; the iterparse API used below is
+# compatible, so the stdlib parser remains a drop-in fallback
+try:
+    from lxml import etree as ET
+    ParseError = ET.XMLSyntaxError
+except ImportError:
+    import xml.etree.ElementTree as ET
+    ParseError = ET.ParseError
+
 import os
 import glob
 
+# Indentation strings precomputed for every realistic nesting depth,
+# so the hot loop indexes a tuple instead of allocating '  ' * level
+INDENTS = tuple('  ' * i for i in range(64))
+
 def process_svg(svg_file):
     if not os.path.isfile(svg_file):
         print(f"Error: The file '{svg_file}' does not exist.")
@@ -33,32 +48,44 @@ def process_svg(svg_file):
 
     try:
         relative_path = os.path.relpath(svg_file)
-        tree = ET.parse(svg_file)
-        root = tree.getroot()
-        
-        with open('svg-styling.text', 'w') as f:
-            f.write(f"SVG File: {relative_path}\n\n")
-            
-            def process_element(element, level=0):
-                tag = element.tag.split('}')[-1]
-                attrs = element.attrib.copy()
+
+        # Buffer the whole report and write it once at the end instead
+        # of issuing two small writes per element
+        parts = [f"SVG File: {relative_path}\n\n"]
+
+        # Stream the document with iterparse instead of building the
+        # full tree: each element is cleared as soon as it closes, so
+        # only the chain of currently-open elements stays in memory
+        level = 0
+        for event, element in ET.iterparse(svg_file, events=('start', 'end')):
+            # rpartition strips the '{namespace}' prefix in one C call;
+            # with no namespace it leaves the tag untouched
+            tag = element.tag.rpartition('}')[2]
+
+            if event == 'start':
+                # dict() works on both stdlib attrib dicts and lxml's
+                # _Attrib proxy, which has no .copy() method
+                attrs = dict(element.attrib)
 
                 if tag == 'path' and 'd' in attrs:
                     attrs['d'] = '--some-arbitrary-path'
-                
-                attr_str = ' '.join(f'{k}="{v}"' for k, v in attrs.items())
-                f.write('  ' * level + f"<{tag} {attr_str}>\n")
-                
-                for child in element:
-                    process_element(child, level + 1)
-                
-                f.write('  ' * level + f"</{tag}>\n")
-            
-            process_element(root)
+
+                attr_str = ''.join(f' {k}="{v}"' for k, v in attrs.items())
+                indent = INDENTS[level] if level < 64 else '  ' * level
+                parts.append(f"{indent}<{tag}{attr_str}>\n")
+                level += 1
+            else:
+                level -= 1
+                indent = INDENTS[level] if level < 64 else '  ' * level
+                parts.append(f"{indent}</{tag}>\n")
+                element.clear()
+
+        with open('svg-styling.text', 'w') as f:
+            f.write("".join(parts))
         
         print(f"🎉 Processing complete. Output written to 'svg-styling.text'")
     
-    except ET.ParseError:
+    except ParseError:
         print(f"❌ Error: Unable to parse '{svg_file}'. Make sure it's a valid SVG file.")
     except Exception as e:
         print(f"❌ An unexpected error occurred: {e}")
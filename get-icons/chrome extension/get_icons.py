@@ -25,12 +25,15 @@ Version: 1.0
 """
 
 from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import os
 import json
+import re
 
 # Define required sizes for Chrome Extension icons
 sizes = [16, 32, 48, 128, 256, 512]
-supported_formats = ['.png', '.jpg', '.jpeg', '.svg', '.webp', '.gif']
+supported_formats = frozenset({'.png', '.jpg', '.jpeg', '.svg', '.webp', '.gif'})
 
 # Get the absolute path of the script's directory
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -39,48 +42,82 @@ os.chdir(script_dir)  # Change working directory to script's location
 # Find all image files in the script's directory
 def find_image_files():
     """Returns a list of image files in the current directory with supported formats."""
-    return [file for file in os.listdir(script_dir) if os.path.splitext(file)[1].lower() in supported_formats]
+    # scandir's cached is_file() avoids a stat per entry, and the
+    # frozenset membership test replaces a linear scan of the formats
+    return [entry.name for entry in os.scandir(script_dir)
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in supported_formats]
+
+# Matches the batch folders produced below: 'icons', 'icons-1', 'icons-2', ...
+icon_folder_pattern = re.compile(r'^icons(?:-(\d+))?$')
 
 # Determine the next available folder name for storing icons
 def get_next_icon_folder():
     """Generates a unique folder name for each batch of icons."""
-    base_folder = "icons"
-    counter = 0
-    
-    while True:
-        folder_name = f"{base_folder}-{counter}" if counter > 0 else base_folder
-        folder_path = os.path.join(script_dir, folder_name)
-        if not os.path.exists(folder_path):
-            return folder_path
-        counter += 1
+    # One directory listing replaces an os.path.exists stat per candidate
+    # name: find the highest existing batch number and go one past it
+    highest = -1
+    for entry in os.scandir(script_dir):
+        match = icon_folder_pattern.match(entry.name)
+        if match and entry.is_dir():
+            highest = max(highest, int(match.group(1) or 0))
+
+    folder_name = "icons" if highest < 0 else f"icons-{highest + 1}"
+    return os.path.join(script_dir, folder_name)
+
+# Process a single image (top-level so it can run in a worker process)
+def _process_one_image(image_filename, icon_prefix, output_dir):
+    """Generates all icon sizes for one image and returns its manifest entries."""
+    manifest_icons = {}
+    image_path = os.path.join(script_dir, image_filename)
+
+    try:
+        # Open image and decode it once up front
+        img = Image.open(image_path)
+        img.load()
+
+        # Generate resized icons largest-first: each size is
+        # produced from the previous (slightly larger) result, so
+        # the expensive LANCZOS filter runs over the full-size
+        # source only once instead of once per size
+        current = img.convert("RGBA")
+        for size in sorted(sizes, reverse=True):
+            output_filename = f"{icon_prefix}-{size}.png"
+            output_file = os.path.join(output_dir, output_filename)
+
+            current = current.resize((size, size), Image.LANCZOS)
+            current.save(output_file, format="PNG")
+
+            # Add to manifest format
+            manifest_icons[str(size)] = os.path.join(os.path.basename(output_dir), output_filename)
+
+    except Exception as e:
+        print(f"❌ Error processing {image_filename}: {e}")
+
+    return manifest_icons
 
 # Load and process each image
 def generate_icons_for_images(image_files, icon_prefix, output_dir):
     """Generates icons for each found image and returns a list for Chrome manifest."""
     manifest_icons = {}
-    
+
     os.makedirs(output_dir, exist_ok=True)
 
-    for image_filename in image_files:
-        image_path = os.path.join(script_dir, image_filename)
-        
-        try:
-            # Open image
-            img = Image.open(image_path)
-
-            # Generate resized icons
-            for size in sizes:
-                output_filename = f"{icon_prefix}-{size}.png"
-                output_file = os.path.join(output_dir, output_filename)
-                
-                resized_img = img.resize((size, size), Image.LANCZOS)
-                resized_img.save(output_file, format="PNG")
-                
-                # Add to manifest format
-                manifest_icons[str(size)] = os.path.join(os.path.basename(output_dir), output_filename)
-
-        except Exception as e:
-            print(f"❌ Error processing {image_filename}: {e}")
+    # With several source images, give each its own filename prefix:
+    # parallel workers would otherwise truncate and write the very same
+    # {prefix}-{size}.png paths concurrently. A single image keeps the
+    # plain prefix the manifest examples use.
+    if len(image_files) == 1:
+        prefixes = [icon_prefix]
+    else:
+        prefixes = [f"{icon_prefix}-{os.path.splitext(name)[0]}" for name in image_files]
+
+    # Each worker opens its own image and writes its own files, so no
+    # state is shared and the compute-bound LANCZOS resizes run on all
+    # cores in parallel
+    with ProcessPoolExecutor() as executor:
+        for result in executor.map(_process_one_image, image_files,
+                                   prefixes, repeat(output_dir)):
+            manifest_icons.update(result)
 
     return manifest_icons
 
@@ -0,0 +1,44 @@
+# cython: language_level=3
+"""
+Compiled binary-splitting kernel for the Chudnovsky series.
+
+Near the leaves of the recursion each node is only a handful of
+small-integer multiplications, so CPython's bytecode dispatch is most
+of the cost there. Cython types those coefficients as C integers and
+compiles the recursion itself; the big accumulators stay gmpy2 mpz
+objects whose arithmetic already runs inside GMP.
+
+Build in place with:
+
+    python setup.py build_ext --inplace
+
+get_pi_sequence.py picks the extension up automatically when present
+and falls back to the pure-Python recursion otherwise.
+"""
+
+from gmpy2 import mpz
+
+# 640320**3 // 24; fits comfortably in 64 bits
+cdef long long _C3_OVER_24 = 10939058860032000
+
+
+def chudnovsky_bs(long long a, long long b):
+    """Return the (P, Q, T) triple for Chudnovsky terms [a, b)."""
+    cdef long long m
+    if b - a == 1:
+        if a == 0:
+            P = Q = mpz(1)
+        else:
+            # (6a-5)(2a-1) stays within 64 bits for any realistic term
+            # count; the remaining factors go through mpz
+            P = mpz((6 * a - 5) * (2 * a - 1)) * (6 * a - 1)
+            Q = mpz(a * a) * a * _C3_OVER_24
+        T = P * (13591409 + 545140134 * a)
+        if a & 1:
+            T = -T
+        return P, Q, T
+
+    m = (a + b) // 2
+    P1, Q1, T1 = chudnovsky_bs(a, m)
+    P2, Q2, T2 = chudnovsky_bs(m, b)
+    return P1 * P2, Q1 * Q2, Q2 * T1 + P1 * T2
@@ -0,0 +1,19 @@
+"""
+Optional build script for the compiled Chudnovsky kernel.
+
+Requires Cython and gmpy2:
+
+    pip install Cython gmpy2
+    python setup.py build_ext --inplace
+
+The main script works without the extension; this only speeds up the
+binary-splitting recursion.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="pi-digit-formatter",
+    ext_modules=cythonize("_chudnovsky.pyx"),
+)
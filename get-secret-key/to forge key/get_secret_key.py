@@ -73,6 +73,19 @@ def generate_hmac_key(secret="my_secret"):
     """Generate an HMAC-SHA256 key."""
     return hmac.new(secret.encode(), b"secure_data", hashlib.sha256).hexdigest()
 
+# Menu choice -> generator function, built once at import time instead
+# of on every invocation of main()
+KEY_GENERATORS = {
+    1: generate_random_key,
+    2: generate_uuid_key,
+    3: generate_hex_key,
+    4: generate_sha256_key,
+    5: generate_base64_key,
+    6: generate_numeric_key,
+    7: generate_passphrase,
+    8: generate_hmac_key,
+}
+
 # COUNTDOWN TIMER BEFORE KEY ERASURE
 def countdown_timer(seconds):
     """Displays a countdown timer and wipes the key after time runs out."""
@@ -138,17 +151,7 @@ def main():
         seconds = 20
 
     # Generate the selected key
-    key_generators = {
-        1: generate_random_key,
-        2: generate_uuid_key,
-        3: generate_hex_key,
-        4: generate_sha256_key,
-        5: generate_base64_key,
-        6: generate_numeric_key,
-        7: generate_passphrase,
-        8: generate_hmac_key,
-    }
-    key = key_generators[choice]()  # Call the selected function
+    key = KEY_GENERATORS[choice]()  # Call the selected function
 
     # Display the generated key
     print("\n🔑 Generated Key (Copy it now! It will be destroyed soon):\n")